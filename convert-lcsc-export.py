@@ -1,18 +1,63 @@
 import csv
 import sys
 
-def extract_lcsc_and_quantity(input_file, output_file=None):
-    out = sys.stdout if output_file is None else open(output_file, "w", newline="")
+# pandas parses and writes the CSV in C, fall back to the csv module if it is not installed
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+LCSC_COLUMN = "LCSC Part Number"
+QUANTITY_COLUMN = "Quantity"
+
+def extract_with_pandas(input_file, out):
+    try:
+        df = pd.read_csv(
+            input_file,
+            usecols=lambda column: column in (LCSC_COLUMN, QUANTITY_COLUMN),
+            dtype=str,
+            keep_default_na=False,
+            encoding="utf-8",
+        )
+    except pd.errors.EmptyDataError:
+        return
+    if LCSC_COLUMN not in df or QUANTITY_COLUMN not in df:
+        return
+
+    lcsc = df[LCSC_COLUMN].fillna("").str.strip()
+    qty = df[QUANTITY_COLUMN].fillna("").str.strip()
+    result = pd.DataFrame({LCSC_COLUMN: lcsc, QUANTITY_COLUMN: qty})[(lcsc != "") & (qty != "")]
+    result.to_csv(out, header=False, index=False, lineterminator="\n")
+
+def extract_with_csv(input_file, out):
+    writer = csv.writer(out, lineterminator="\n")
 
     with open(input_file, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+
+        header = next(reader, [])
+        if LCSC_COLUMN in header and QUANTITY_COLUMN in header:
+            lcsc_col = header.index(LCSC_COLUMN)
+            qty_col = header.index(QUANTITY_COLUMN)
+            min_len = max(lcsc_col, qty_col) + 1
 
-        for row in reader:
-            lcsc = row.get("LCSC Part Number", "").strip()
-            qty = row.get("Quantity", "").strip()
+            for row in reader:
+                if len(row) < min_len:
+                    continue
 
-            if lcsc and qty:
-                out.write(f"{lcsc},{qty}\n")
+                lcsc = row[lcsc_col].strip()
+                qty = row[qty_col].strip()
+
+                if lcsc and qty:
+                    writer.writerow((lcsc, qty))
+
+def extract_lcsc_and_quantity(input_file, output_file=None):
+    out = sys.stdout if output_file is None else open(output_file, "w", newline="", buffering=1 << 20)
+
+    if pd is not None:
+        extract_with_pandas(input_file, out)
+    else:
+        extract_with_csv(input_file, out)
 
     if output_file is not None:
         out.close()
@@ -26,4 +71,3 @@ if __name__ == "__main__":
     output_csv = sys.argv[2] if len(sys.argv) > 2 else None
 
     extract_lcsc_and_quantity(input_csv, output_csv)
-
@@ -2,42 +2,203 @@
 """LCSC Part Importer for Part-DB using browser automation."""
 
 import argparse
+import asyncio
 import csv
+import itertools
+import json
 import logging
+import logging.handlers
+import os
 import re
+import sqlite3
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode, urljoin, urlsplit
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 from tqdm import tqdm
 
 # Constants
 SELECTOR_HELP_TEXT = "#part_base_category_help"
 SELECTOR_SAVE = "#part_base_save"
-SELECTOR_OPTION = '.ts-dropdown .option[data-value]'
-SELECTOR_CREATE = '.ts-dropdown .create'
 SELECTOR_CATEGORY_INPUT = '#part_base_category'
-# TomSelect control specifically for category (next sibling of the select element)
-SELECTOR_CATEGORY_CONTROL = '#part_base_category + .ts-wrapper .ts-control'
+# Any page content, used to confirm the account page loaded after login
+SELECTOR_LOGGED_IN = 'main, .content, body'
+
+# Search selectors
+SELECTOR_PART_LINK = 'a[href*="/en/part/"][href*="/info"]'
+SELECTOR_SEARCH_EMPTY = '.dataTables_empty, .dt-empty'
+# Search results are loaded asynchronously, wait for either a part link or the empty table row
+SELECTOR_SEARCH_RESULTS = f'{SELECTOR_PART_LINK}, {SELECTOR_SEARCH_EMPTY}'
 
 # Stock management selectors
 SELECTOR_STOCKS_TAB = 'a.nav-link[href="#part_lots"]'
-SELECTOR_COMMON_TAB = 'a.nav-link[href="#common"]'
+SELECTOR_STOCKS_SECTION = '#part_lots'
 SELECTOR_ADD_STOCK = 'button[data-action="elements--collection-type#createElement"]'
-
-TIMEOUT_MS = 30000
+SELECTOR_STORAGE_SELECT = 'select[name*="[partLots]"][name*="[storage_location]"]'
+SELECTOR_AMOUNT_INPUT = 'input[name*="[partLots]"][name*="[amount][value]"]'
+
+# Adds a stock entry, selects the "Unspecified" storage location and enters the amount in one go.
+# Returns whether the storage location could be selected.
+JS_ADD_STOCK = """async ([lotsSelector, addStockSelector, storageSelector, amountSelector, amount, timeout]) => {
+    const lots = document.querySelector(lotsSelector);
+    const before = lots.querySelectorAll(amountSelector).length;
+    const addStock = [...lots.querySelectorAll(addStockSelector)].find(b => b.textContent.includes('Add stock'));
+    addStock.click();
+
+    // TomSelect is attached to the new storage select once Stimulus connects its controller
+    let storage = null;
+    for (const deadline = Date.now() + timeout; Date.now() < deadline;) {
+        storage = [...lots.querySelectorAll(storageSelector)].pop();
+        if (lots.querySelectorAll(amountSelector).length > before && storage?.tomselect) break;
+        await new Promise(resolve => setTimeout(resolve, 100));
+    }
+
+    const amountInput = [...lots.querySelectorAll(amountSelector)].pop();
+    if (lots.querySelectorAll(amountSelector).length <= before) throw new Error('Stock form did not appear');
+    amountInput.value = String(amount);
+    amountInput.dispatchEvent(new Event('input', {bubbles: true}));
+    amountInput.dispatchEvent(new Event('change', {bubbles: true}));
+
+    const ts = storage?.tomselect;
+    const value = [...(storage?.options ?? [])].find(o => o.text.trim() === 'Unspecified')?.value
+        ?? Object.keys(ts?.options ?? {}).find(v => String(ts.options[v][ts.settings.labelField]).trim() === 'Unspecified');
+    if (value === undefined) return false;
+    if (ts) {
+        ts.addItem(value);
+    } else {
+        storage.value = value;
+        storage.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return true;
+}"""
+
+# Collect attributes of all matched elements in a single round trip
+JS_HREFS = "els => els.map(e => e.getAttribute('href'))"
+
+# True once TomSelect has been attached to the select element
+JS_TOMSELECT_READY = "selector => document.querySelector(selector)?.tomselect !== undefined"
+# Returns [value, text] of all category options, with the text as the dropdown would render it
+JS_CATEGORY_OPTIONS = """(select) => {
+    const ts = select.tomselect;
+    return Object.entries(ts.options).map(([value, data]) => [
+        value,
+        (ts.render('option', data)?.textContent ?? String(data[ts.settings.labelField])).trim()
+    ]);
+}"""
+# Selects the category option with the given value, or creates a new category if value is null.
+# Returns whether a category was selected.
+JS_SET_CATEGORY = """(select, [value, text]) => {
+    const ts = select.tomselect;
+    ts.clear(true);
+    if (value !== null) {
+        ts.addItem(value);
+        return true;
+    }
+    return ts.createItem(text);
+}"""
+
+# Serializes the form of the given submit button like the browser would submit it.
+# File inputs are left out, the importer never uploads files.
+JS_FORM_DATA = """(submitter) => ({
+    action: submitter.form.action,
+    entries: [...new FormData(submitter.form, submitter).entries()].filter(([, v]) => typeof v === 'string')
+})"""
+
+# Validation errors and flash messages shown on a rejected form
+SELECTOR_FORM_ERRORS = '.invalid-feedback, .alert-danger, .alert-warning, .toast-body'
+# Returns the texts of all elements matching the selector in the given HTML document
+JS_HTML_TEXTS = """([html, selector]) => {
+    const doc = new DOMParser().parseFromString(html, 'text/html');
+    return [...doc.querySelectorAll(selector)].map(e => e.textContent.trim().replace(/\\s+/g, ' ')).filter(t => t);
+}"""
+
+# Timeouts for page loads and requests, element waits and TomSelect widgets
+# (all scaled by --timeout-multiplier)
+NAV_TIMEOUT_MS = 15000
+SELECTOR_TIMEOUT_MS = 5000
+AUTOCOMPLETE_TIMEOUT_MS = 3000
+# Page size requested when listing collections from the Part-DB API
+API_PAGE_SIZE = 100
+# How long cached existence checks stay valid
+CACHE_TTL_S = 7 * 24 * 60 * 60
+# Part ID from a part page URL like /en/part/8/info
+PART_URL_RE = re.compile(r'/en/part/(\d+)/')
+# Part ID from an API IRI like /api/parts/8
+PART_IRI_RE = re.compile(r'/parts/(\d+)')
+# LCSC ID from a product URL like lcsc.com/product-detail/C2962094
+LCSC_URL_RE = re.compile(r'lcsc\.com/product-detail/(C\d+)')
+
+LOG_FORMAT = '[%(asctime)s] [%(levelname)s] %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+# Log records are buffered and written to the log file in batches (or immediately on errors)
+LOG_BUFFER_RECORDS = 512
+
+# Saved login session per Part-DB host, reused by later runs
+AUTH_STATE_FILE = ".partdb_auth.{host}.json"
+
+# Images, fonts and media the importer never looks at (stylesheets are kept, visibility checks
+# depend on them). Blocked in the browser itself, so the HTTP cache stays enabled.
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm",
+)
+BLOCKED_URL_PATTERNS = [f"*.{ext}{query}" for ext in BLOCKED_EXTENSIONS for query in ("", "?*")]
+# Number of parallel browser contexts used for importing
+DEFAULT_WORKERS = 4
+
+
+def is_lcsc_id(value: str) -> bool:
+    """Check whether value is a valid LCSC part number like C2962094."""
+    return value.startswith("C") and value[1:].isdecimal()
+
+
+async def prompt_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    Ctrl-C aborts the prompt right away, as the daemon thread does not keep the process alive."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def read_line():
+        line = input(prompt)
+        loop.call_soon_threadsafe(lambda: future.done() or future.set_result(line))
+
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
 
 
 class LCSCImporter:
     """Main importer class for LCSC parts."""
 
-    def __init__(self, base_url: str, csv_path: str):
+    def __init__(self, base_url: str, csv_path: str, workers: int = DEFAULT_WORKERS,
+                 force_rescrape: bool = False, timeout_multiplier: float = 1.0, headed: bool = False):
         self.base_url = base_url
         self.csv_path = Path(csv_path)
+        self.workers = max(1, workers)
+        self.force_rescrape = force_rescrape
+        self.headed = headed
+        self.nav_timeout = NAV_TIMEOUT_MS * timeout_multiplier
+        self.selector_timeout = SELECTOR_TIMEOUT_MS * timeout_multiplier
+        self.autocomplete_timeout = AUTOCOMPLETE_TIMEOUT_MS * timeout_multiplier
         self.browser = None
+        self.context = None
         self.page = None
         self.playwright = None
+        self.auth_state = None  # Session cookies shared with all worker contexts
+        # Characters like the port separator are not allowed in file names on every platform
+        host = re.sub(r"[^\w.-]", "_", urlsplit(base_url or "").netloc)
+        self.auth_state_file = Path(AUTH_STATE_FILE.format(host=host))
+        self._existing_lcsc_ids = None  # LCSC ID -> Part ID, None if unavailable
+        self._existing_loaded = False
+        self._existing_lock = asyncio.Lock()
+        self._part_locks = {}  # LCSC ID -> Lock, so duplicate CSV rows are not imported in parallel
+        self._category_locks = {}  # Category -> Lock, so new categories are not created in parallel
+        self._created_categories = set()  # New categories created during this run
+        self.started_at = int(time.time())
 
         # Setup logging
         self.log_dir = Path("logs")
@@ -47,71 +208,141 @@ class LCSCImporter:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = self.log_dir / f"import_{timestamp}.log"
 
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+
+        # The level is set from --log-level in main()
         logging.basicConfig(
-            level=logging.DEBUG,
-            format='[%(asctime)s] [%(levelname)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
+            format=LOG_FORMAT,
+            datefmt=LOG_DATEFMT,
             handlers=[
-                logging.FileHandler(log_file),
+                logging.handlers.MemoryHandler(
+                    LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=file_handler
+                ),
                 logging.StreamHandler()
             ]
         )
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Log file: {log_file}")
 
+        # Cache of existence checks per Part-DB instance (part_id is NULL if the part was not found)
+        self.cache = sqlite3.connect(self.log_dir / "lcsc_cache.sqlite")
+        with self.cache:
+            self.cache.execute(
+                "CREATE TABLE IF NOT EXISTS part_cache "
+                "(base_url TEXT, lcsc_id TEXT, part_id INTEGER, checked_at INTEGER, "
+                "PRIMARY KEY (base_url, lcsc_id))"
+            )
+
         self.success_count = 0
         self.fail_count = 0
         self.skipped_count = 0
         self.failed_parts = []  # Track which parts failed
 
-    def authenticate(self):
-        """Interactive login to Part-DB via browser."""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=False)
-        self.page = self.browser.new_page()
+    async def new_context(self, **kwargs):
+        """Create a browser context with the importer's default timeouts."""
+        context = await self.browser.new_context(**kwargs)
+        context.set_default_navigation_timeout(self.nav_timeout)
+        context.set_default_timeout(self.selector_timeout)
+        return context
+
+    async def authenticate(self):
+        """Login to Part-DB, reusing the saved session if it is still valid."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=not self.headed)
+
+        if self.auth_state_file.exists():
+            self.logger.info(f"Reusing saved session from {self.auth_state_file}")
+            self.context = await self.new_context(storage_state=self.auth_state_file)
+            self.page = await self.context.new_page()
+            if await self.verify_authentication():
+                return
+
+            self.logger.warning("Saved session is no longer valid, please login again")
+            await self.context.close()
+
+        await self.interactive_login()
+        self.context = await self.new_context(storage_state=self.auth_state_file)
+        self.page = await self.context.new_page()
+        if not await self.verify_authentication():
+            self.logger.error("Authentication failed")
+            sys.exit(1)
+
+    async def interactive_login(self):
+        """Interactive login to Part-DB via a browser window. Saves the session to self.auth_state_file."""
+        # The login always needs a visible window, even if importing runs headless
+        browser = self.browser if self.headed else await self.playwright.chromium.launch(headless=False)
+        context = await browser.new_context()
+        page = await context.new_page()
 
         # Open login page
         login_url = f"{self.base_url}/en/login?_target_path=%2F"
         self.logger.info("Opening login page in browser...")
-        self.page.goto(login_url, wait_until="networkidle", timeout=TIMEOUT_MS)
+        await page.goto(login_url, wait_until="domcontentloaded", timeout=self.nav_timeout)
 
         # Prompt user to login manually in the browser
         self.logger.info("=" * 60)
         self.logger.info("Please login in the browser window that just opened.")
         self.logger.info("=" * 60)
-        input("Press Enter after you have successfully logged in...")
-
-        # Verify authentication by checking account info page
+        await prompt_input("Press Enter after you have successfully logged in...")
+
+        await self.save_auth_state(context)
+        await context.close()
+        if browser is not self.browser:
+            await browser.close()
+
+    async def save_auth_state(self, context) -> dict:
+        """Save the session cookies of the context so later runs can skip the login. Returns the state."""
+        state = await context.storage_state()
+        # The file contains session cookies, keep it private from the start
+        fd = os.open(self.auth_state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # In case the file already existed with other permissions
+        with os.fdopen(fd, "w") as f:
+            json.dump(state, f)
+        return state
+
+    async def verify_authentication(self) -> bool:
+        """Verify that self.context is logged in and share its session with the worker contexts."""
         account_url = f"{self.base_url}/en/user/info"
         self.logger.info("Verifying authentication...")
 
         try:
-            self.page.goto(account_url, wait_until="networkidle", timeout=TIMEOUT_MS)
+            await self.page.goto(account_url, wait_until="domcontentloaded")
 
             # Check if we're still on account info page (not redirected to login)
             if "/login" in self.page.url:
-                self.logger.error("Authentication failed - still at login page")
-                sys.exit(1)
+                self.logger.warning("Not logged in - redirected to login page")
+                return False
 
             # Check for user info elements to confirm we're logged in
             # Look for common elements on account page
-            self.page.wait_for_selector('main, .content, body', timeout=5000)
-
-            self.logger.info("Authentication successful!")
+            await self.page.wait_for_selector(SELECTOR_LOGGED_IN)
 
         except PlaywrightTimeout:
-            self.logger.error("Failed to verify authentication")
-            sys.exit(1)
+            self.logger.warning("Failed to verify authentication")
+            return False
 
-    def load_parts_csv(self) -> list:
-        """Load and validate CSV file."""
-        self.logger.info(f"Loading parts from {self.csv_path}")
+        # Export the session so worker contexts (and later runs) can reuse it
+        self.auth_state = await self.save_auth_state(self.context)
+        self.logger.info("Authentication successful!")
+        return True
 
+    def count_parts_csv(self) -> int:
+        """Count the non-empty rows in the CSV file (used as progress bar total)."""
         if not self.csv_path.exists():
             self.logger.error(f"CSV file not found: {self.csv_path}")
             sys.exit(1)
 
-        parts = []
+        with open(self.csv_path, 'r') as f:
+            total = sum(1 for line in f if line.strip())
+
+        self.logger.info(f"Found {total} rows to import")
+        return total
+
+    def load_parts_csv(self):
+        """Lazily load and validate CSV file. Yields (lcsc_id, amount) tuples."""
+        self.logger.info(f"Loading parts from {self.csv_path}")
+
         with open(self.csv_path, 'r') as f:
             reader = csv.reader(f)
             for row in reader:
@@ -122,23 +353,117 @@ class LCSCImporter:
                 lcsc_id, amount = row[0].strip(), row[1].strip()
 
                 # Validate LCSC ID format
-                if not re.match(r'^C\d+$', lcsc_id):
+                if not is_lcsc_id(lcsc_id):
                     self.logger.warning(f"Invalid LCSC ID format: {lcsc_id}")
                     continue
 
                 try:
                     amount = int(amount)
-                    parts.append((lcsc_id, amount))
                 except ValueError:
                     self.logger.warning(f"Invalid amount for {lcsc_id}: {amount}")
                     continue
 
-        self.logger.info(f"Found {len(parts)} parts to import")
-        return parts
-
-    def check_part_exists(self, lcsc_id: str) -> bool:
+                yield (lcsc_id, amount)
+
+    async def fetch_api_collection(self, page, resource: str) -> list:
+        """Fetch all items of a Part-DB API collection, following pagination links."""
+        items = []
+        url = f"{self.base_url}/api/{resource}?itemsPerPage={API_PAGE_SIZE}"
+        while url:
+            response = await page.request.get(
+                url,
+                headers={"Accept": "application/ld+json"},
+                timeout=self.nav_timeout
+            )
+            if not response.ok:
+                raise RuntimeError(f"GET {url} returned HTTP {response.status}")
+
+            # Newer API Platform versions omit the "hydra:" prefix
+            data = await response.json()
+            items.extend(data.get("hydra:member", data.get("member", [])))
+            view = data.get("hydra:view", data.get("view", {}))
+            next_page = view.get("hydra:next", view.get("next"))
+            url = urljoin(self.base_url, next_page) if next_page else None
+
+        return items
+
+    async def load_existing_lcsc_ids(self, page) -> dict:
+        """Load the LCSC IDs of all parts already in the database. Returns a map of LCSC ID to Part ID."""
+        self.logger.info("Loading existing LCSC parts from Part-DB...")
+
+        suppliers = await self.fetch_api_collection(page, "suppliers")
+        lcsc_suppliers = {
+            supplier.get("@id") for supplier in suppliers
+            if "lcsc" in supplier.get("name", "").lower()
+        }
+        self.logger.debug("LCSC suppliers: %s", lcsc_suppliers)
+
+        existing = {}
+        for orderdetail in await self.fetch_api_collection(page, "orderdetails"):
+            if orderdetail.get("supplier") not in lcsc_suppliers:
+                continue
+
+            lcsc_id = (orderdetail.get("supplierpartnr") or "").strip()
+            match = PART_IRI_RE.search(str(orderdetail.get("part")))
+            if match and is_lcsc_id(lcsc_id):
+                existing[lcsc_id] = int(match.group(1))
+
+        self.logger.info(f"Found {len(existing)} existing LCSC parts")
+        return existing
+
+    async def check_part_exists(self, page, lcsc_id: str) -> bool:
         """Check if part already exists in database with exact LCSC ID match."""
-        self.logger.debug(f"Checking if {lcsc_id} already exists")
+        # --force-rescrape still uses checks from this run, so duplicate CSV rows are skipped
+        min_checked_at = self.started_at if self.force_rescrape else int(time.time()) - CACHE_TTL_S
+        row = self.cache.execute(
+            "SELECT part_id FROM part_cache WHERE base_url = ? AND lcsc_id = ? AND checked_at >= ?",
+            (self.base_url, lcsc_id, min_checked_at)
+        ).fetchone()
+        if row is not None:
+            self.logger.debug("Using cached existence check for %s", lcsc_id)
+            return row[0] is not None
+
+        try:
+            part_id = await self.lookup_part_id(page, lcsc_id)
+        except Exception as e:
+            self.logger.warning(f"Error checking if part exists: {e}")
+            # If we can't verify, assume it doesn't exist to allow import
+            return False
+
+        self.cache_part(lcsc_id, part_id)
+        return part_id is not None
+
+    async def lookup_part_id(self, page, lcsc_id: str):
+        """Look up the Part ID for an LCSC ID in the database. Returns None if not found."""
+        # Existing parts are only loaded on the first cache miss
+        async with self._existing_lock:
+            if not self._existing_loaded:
+                self._existing_loaded = True
+                try:
+                    self._existing_lcsc_ids = await self.load_existing_lcsc_ids(page)
+                except Exception as e:
+                    self.logger.warning(f"Could not load existing parts from API ({e}), searching for each part instead")
+
+        if self._existing_lcsc_ids is not None:
+            return self._existing_lcsc_ids.get(lcsc_id)
+
+        return await self.search_part_id(page, lcsc_id)
+
+    def cache_part(self, lcsc_id: str, part_id):
+        """Store the result of an existence check in the cache (part_id is None if not found)."""
+        if self._existing_lcsc_ids is not None and part_id is not None:
+            self._existing_lcsc_ids[lcsc_id] = part_id
+
+        with self.cache:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO part_cache (base_url, lcsc_id, part_id, checked_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.base_url, lcsc_id, part_id, int(time.time()))
+            )
+
+    async def search_part_id(self, page, lcsc_id: str):
+        """Find the Part ID for an LCSC ID by searching in the web UI. Returns None if not found."""
+        self.logger.debug("Checking if %s already exists", lcsc_id)
 
         # Search for the part
         search_url = (
@@ -147,70 +472,65 @@ class LCSCImporter:
             f"storelocation=1&comment=1&ipn=1&ordernr=1&keyword={lcsc_id}"
         )
 
-        try:
-            self.page.goto(search_url, wait_until="networkidle", timeout=TIMEOUT_MS)
-
-            # Check if any results found - look for part links
-            part_links = self.page.locator('a[href*="/en/part/"][href*="/info"]').all()
-
-            if not part_links:
-                self.logger.debug(f"No search results found for {lcsc_id}")
-                return False
-
-            # Check each result to verify exact LCSC ID match
-            visited = set()
-            for link in part_links:
-                href = link.get_attribute('href')
-                # Extract part ID from URL like /en/part/8/info
-                match = re.search(r'/en/part/(\d+)/', href)
-                if not match:
-                    continue
-
-                part_id = match.group(1)
-                if part_id in visited:
-                    continue
-                self.logger.debug(f"Checking part ID {part_id} for exact LCSC match")
-                visited.add(part_id)
-
-                # Navigate to suppliers page
-                suppliers_url = f"{self.base_url}/en/part/{part_id}/info#suppliers"
-                self.page.goto(suppliers_url, wait_until="networkidle", timeout=TIMEOUT_MS)
-
-                # Get all LCSC links and extract IDs from URLs
-                lcsc_links = self.page.locator('a[href*="lcsc.com"]').all()
-                self.logger.debug(f"Found {len(lcsc_links)} LCSC links to check")
-
-                for lcsc_link in lcsc_links:
-                    href = lcsc_link.get_attribute('href')
-                    # Extract LCSC ID from URL pattern: lcsc.com/product-detail/C[numbers]
-                    match = re.search(r'lcsc\.com/product-detail/(C\d+)', href)
-                    if match:
-                        link_lcsc_id = match.group(1)
-                        self.logger.debug(f"Comparing extracted ID '{link_lcsc_id}' with '{lcsc_id}'")
-                        # Exact match check (handles prefix issue: C1991 vs C19915)
-                        if link_lcsc_id == lcsc_id:
-                            self.logger.info(f"Part {lcsc_id} already exists (Part ID: {part_id})")
-                            return True
-
-            self.logger.debug(f"No exact match found for {lcsc_id} (only prefix matches)")
-            return False
-
-        except Exception as e:
-            self.logger.warning(f"Error checking if part exists: {e}")
-            # If we can't verify, assume it doesn't exist to allow import
-            return False
+        # A timeout raises, results that did not load must not be mistaken (and cached) as not found
+        await page.goto(search_url, wait_until="domcontentloaded")
+        await page.wait_for_selector(SELECTOR_SEARCH_RESULTS)
+
+        # Check if any results found - look for part links
+        part_hrefs = await page.locator(SELECTOR_PART_LINK).evaluate_all(JS_HREFS)
+
+        if not part_hrefs:
+            if not await page.locator(SELECTOR_SEARCH_EMPTY).count():
+                raise RuntimeError(f"Search results for {lcsc_id} could not be read")
+            self.logger.debug("No search results found for %s", lcsc_id)
+            return None
+
+        # Check each result to verify exact LCSC ID match
+        visited = set()
+        for href in part_hrefs:
+            # Extract part ID from URL like /en/part/8/info
+            match = PART_URL_RE.search(href or "")
+            if not match:
+                continue
+
+            part_id = match.group(1)
+            if part_id in visited:
+                continue
+            self.logger.debug("Checking part ID %s for exact LCSC match", part_id)
+            visited.add(part_id)
+
+            # Fetch the part info page without rendering it, the supplier
+            # links are part of the server-rendered HTML
+            info_url = f"{self.base_url}/en/part/{part_id}/info"
+            response = await page.request.get(info_url, timeout=self.nav_timeout)
+            if not response.ok:
+                raise RuntimeError(f"GET {info_url} returned HTTP {response.status}")
+
+            # Extract LCSC IDs from URL pattern: lcsc.com/product-detail/C[numbers]
+            link_lcsc_ids = LCSC_URL_RE.findall(await response.text())
+            self.logger.debug("Found %s LCSC links to check", len(link_lcsc_ids))
+
+            for link_lcsc_id in link_lcsc_ids:
+                self.logger.debug("Comparing extracted ID '%s' with '%s'", link_lcsc_id, lcsc_id)
+                # Exact match check (handles prefix issue: C1991 vs C19915)
+                if link_lcsc_id == lcsc_id:
+                    self.logger.info(f"Part {lcsc_id} already exists (Part ID: {part_id})")
+                    return int(part_id)
+
+        self.logger.debug("No exact match found for %s (only prefix matches)", lcsc_id)
+        return None
 
     def parse_lcsc_category(self, help_text: str) -> tuple:
         """Extract LCSC category from help text."""
         # Format: "Provider: Circuit Protection -> Varistors, MOVs"
         # (inner_text strips HTML tags, so no <b> tags present)
-        match = re.search(r'Provider:\s*(.+)', help_text)
-        if not match:
-            self.logger.debug(f"Could not parse category from help text: {help_text}")
+        _, found, rest = help_text.partition("Provider:")
+        category_text = rest.lstrip().partition("\n")[0].strip()
+        if not found or not category_text:
+            self.logger.debug("Could not parse category from help text: %s", help_text)
             return ("", "")
 
-        category_text = match.group(1).strip()
-        self.logger.debug(f"Parsed category text: {category_text}")
+        self.logger.debug("Parsed category text: %s", category_text)
         parts = [p.strip() for p in category_text.split('->')]
 
         if len(parts) == 1:
@@ -218,198 +538,218 @@ class LCSCImporter:
         else:
             return (parts[0], parts[-1])
 
-    def process_single_part(self, lcsc_id: str, amount: int) -> str:
+    async def process_single_part(self, page, lcsc_id: str, amount: int) -> str:
         """Process a single part import. Returns 'success', 'skipped', or 'failed'."""
-        self.logger.debug(f"Processing {lcsc_id} with amount {amount}")
+        self.logger.debug("Processing %s with amount %s", lcsc_id, amount)
 
         try:
-            # NOTE: Existence check disabled - Part-DB search is unreliable
-            # Assumes all parts are new. Import will fail if part already exists.
-            # if self.check_part_exists(lcsc_id):
-            #     self.logger.info(f"Skipping {lcsc_id} - already exists in database")
-            #     return "skipped"
-
-            # Navigate to create page
-            url = f"{self.base_url}/en/part/from_info_provider/lcsc/{lcsc_id}/create"
-            self.logger.debug(f"Navigating to: {url}")
-            self.page.goto(url, wait_until="networkidle", timeout=TIMEOUT_MS)
-
-            # Check if we got redirected to login (session expired)
-            if "/login" in self.page.url:
-                self.logger.error(f"Session expired - redirected to login page")
-                return "failed"
+            if await self.check_part_exists(page, lcsc_id):
+                self.logger.info(f"Skipping {lcsc_id} - already exists in database")
+                return "skipped"
 
-            # Wait for the form to be ready (wait for tabs to load)
-            try:
-                self.page.wait_for_selector(SELECTOR_STOCKS_TAB, timeout=10000)
-            except PlaywrightTimeout:
-                self.logger.error(f"Create form not found - page may not have loaded correctly")
-                self.logger.debug(f"Current URL: {self.page.url}")
+            form = await self.load_create_form(page, lcsc_id, amount)
+            if form is None:
                 return "failed"
+            lcsc_category, category_value = form
 
-            # Step 1: Click on Stocks tab
-            self.logger.debug("Clicking on Stocks tab")
-            stocks_tab = self.page.locator(SELECTOR_STOCKS_TAB)
-            stocks_tab.click()
-            self.page.wait_for_timeout(1000)
+            if not lcsc_category or category_value is not None:
+                return await self.save_part(page, lcsc_id, lcsc_category, category_value)
 
-            # Step 2: Click Add Stock button (within the stocks section only)
-            self.logger.debug("Clicking Add Stock button")
-            add_stock_button = self.page.locator('#part_lots').locator(SELECTOR_ADD_STOCK).filter(has_text="Add stock")
-            add_stock_button.click()
-            self.page.wait_for_timeout(1000)  # Wait for stock form to appear
+            # Only one worker at a time may create a new category, the others wait for it
+            async with self._category_locks.setdefault(lcsc_category, asyncio.Lock()):
+                if lcsc_category in self._created_categories:
+                    # Created by another worker while waiting, reload the form to get it as an option
+                    form = await self.load_create_form(page, lcsc_id, amount)
+                    if form is None:
+                        return "failed"
+                    lcsc_category, category_value = form
+                return await self.save_part(page, lcsc_id, lcsc_category, category_value)
 
-            # Step 3: Select "Unspecified" from storage location dropdown
-            self.logger.debug("Selecting storage location")
-            try:
-                # Find the storage location select element (matches pattern: part_base[partLots][*][storage_location])
-                storage_select = self.page.locator('select[name*="[partLots]"][name*="[storage_location]"]').last
-                storage_id = storage_select.get_attribute('id')
-
-                # Click on the TomSelect control for storage location
-                storage_control = self.page.locator(f'#{storage_id} + .ts-wrapper .ts-control')
-                storage_control.click()
-                self.page.wait_for_timeout(2000)
-
-                # Select "Unspecified" option
-                unspecified_option = self.page.locator('.ts-dropdown .option').filter(has_text="Unspecified").first
-                unspecified_option.click()
-                self.page.wait_for_timeout(1000)
-            except Exception as e:
-                self.logger.warning(f"Could not select storage location: {e}")
-                # Continue anyway - it might already be selected
+        except Exception as e:
+            self.logger.error(f"Error processing {lcsc_id}: {e}")
+            await self.take_error_screenshot(page, lcsc_id)
+            return "failed"
 
-            # Step 4: Enter amount into stock amount field
-            self.logger.debug(f"Entering amount: {amount}")
-            try:
-                # Find the amount input field (matches pattern: part_base[partLots][*][amount][value])
-                amount_input = self.page.locator('input[name*="[partLots]"][name*="[amount][value]"]').last
-                amount_input.fill(str(amount))
-            except Exception as e:
-                self.logger.error(f"Failed to enter amount: {e}")
-                return "failed"
+    async def load_create_form(self, page, lcsc_id: str, amount: int):
+        """Open the create form and add the stock entry. Returns (lcsc_category, category_value),
+        category_value is None if the category does not exist yet. Returns None on failure."""
+        # Navigate to create page
+        url = f"{self.base_url}/en/part/from_info_provider/lcsc/{lcsc_id}/create"
+        self.logger.debug("Navigating to: %s", url)
+        await page.goto(url, wait_until="domcontentloaded")
 
-            # Step 5: Click on Common tab to return to category selection
-            self.logger.debug("Clicking on Common tab")
-            common_tab = self.page.locator(SELECTOR_COMMON_TAB)
-            common_tab.click()
-            self.page.wait_for_timeout(1000)
+        # Check if we got redirected to login (session expired)
+        if "/login" in page.url:
+            self.logger.error(f"Session expired - redirected to login page")
+            return None
 
-            # Step 6: Extract LCSC category from help text
-            try:
-                help_text = self.page.locator(SELECTOR_HELP_TEXT).inner_text(timeout=5000)
-                parent, leaf = self.parse_lcsc_category(help_text)
-                lcsc_category = f"{parent} -> {leaf}" if parent else leaf
-                self.logger.debug(f"Extracted category: {lcsc_category}")
-            except PlaywrightTimeout:
-                self.logger.warning(f"No category help text found for {lcsc_id}")
-                parent, leaf, lcsc_category = "", "", ""
-
-            # Step 7: Clear any existing category selection first
-            try:
-                clear_button = self.page.locator('#part_base_category + .ts-wrapper .clear-button')
-                if clear_button.is_visible():
-                    self.logger.debug("Clearing existing category selection")
-                    clear_button.click()
-                    self.page.wait_for_timeout(1000)
-            except Exception:
-                pass  # No clear button or already empty
-
-            # Step 8: Click on TomSelect control to open dropdown and type category text
-            if lcsc_category:
-                category_control = self.page.locator(SELECTOR_CATEGORY_CONTROL)
-                category_control.click()
-                self.page.wait_for_timeout(500)  # Wait for dropdown to open
-
-                # Step 9: Type the category path first (this filters the dropdown)
-                self.logger.debug(f"Typing category: {lcsc_category}")
-                ts_input = self.page.locator('#part_base_category + .ts-wrapper .ts-control input')
-                ts_input.fill(lcsc_category)
-                self.page.wait_for_timeout(1500)  # Wait for dropdown to filter/update
-
-                # Step 10: Look for matches in the filtered results
-                try:
-                    # Check if there's a match in the filtered options
-                    self.page.wait_for_selector(SELECTOR_OPTION, timeout=2000)
-                    options = self.page.locator(SELECTOR_OPTION).all()
-
-                    self.logger.debug(f"Found {len(options)} filtered options")
-
-                    # Build expected format: dropdown shows "Leaf\n Parent" (with newline)
-                    expected_format = f"{leaf}\n {parent}" if parent else leaf
-                    self.logger.debug(f"Looking for match with format: '{expected_format}'")
-
-                    # Normalize for comparison: keep only alphanumeric chars
-                    def normalize(s):
-                        return ''.join(c.lower() for c in s if c.isalnum())
-
-                    expected_normalized = normalize(expected_format)
-                    self.logger.debug(f"Normalized expected: '{expected_normalized}'")
-
-                    match_found = None
-                    for option in options:
-                        text = option.inner_text().strip()
-                        text_normalized = normalize(text)
-                        self.logger.debug(f"  Checking option: '{text}' (normalized: '{text_normalized}')")
-
-                        # Compare normalized versions (alphanumeric only)
-                        if text_normalized == expected_normalized:
-                            match_found = option
-                            self.logger.debug(f"  -> Match found!")
-                            break
-
-                    if match_found:
-                        self.logger.info(f"Selecting existing category: {lcsc_category}")
-                        match_found.click()
-                    else:
-                        # No match, look for create option
-                        self.logger.debug("No match found, looking for create option")
-                        try:
-                            create_option = self.page.locator(SELECTOR_CREATE).first
-                            self.logger.info(f"Creating new category: {lcsc_category}")
-                            create_option.click()
-                        except Exception as e:
-                            self.logger.warning(f"Could not find create option: {e}")
-                            # Press Enter as fallback
-                            self.logger.info("Pressing Enter as fallback")
-                            ts_input.press("Enter")
-
-                except PlaywrightTimeout:
-                    self.logger.warning("No dropdown options found after typing, pressing Enter")
-                    ts_input.press("Enter")
-
-            # Click save
-            save_button = self.page.locator(SELECTOR_SAVE)
-            save_button.click()
-
-            # Wait for success (redirect or flash message)
-            self.page.wait_for_load_state("networkidle", timeout=10000)
-
-            self.logger.info(f"Successfully imported {lcsc_id}")
-            return "success"
+        # Wait for the form to be ready (wait for tabs to load)
+        try:
+            await page.wait_for_selector(SELECTOR_STOCKS_TAB)
+        except PlaywrightTimeout:
+            self.logger.error(f"Create form not found - page may not have loaded correctly")
+            self.logger.debug("Current URL: %s", page.url)
+            return None
 
+        # Steps 1-5: Add a stock entry with "Unspecified" storage location and the amount
+        self.logger.debug("Adding stock entry with amount: %s", amount)
+        try:
+            storage_selected = await page.evaluate(
+                JS_ADD_STOCK,
+                [SELECTOR_STOCKS_SECTION, SELECTOR_ADD_STOCK, SELECTOR_STORAGE_SELECT, SELECTOR_AMOUNT_INPUT,
+                 amount, self.autocomplete_timeout]
+            )
         except Exception as e:
-            self.logger.error(f"Error processing {lcsc_id}: {e}")
-            self.take_error_screenshot(lcsc_id)
+            self.logger.error(f"Failed to add stock entry: {e}")
+            return None
+
+        if not storage_selected:
+            # Continue anyway - it might already be selected
+            self.logger.warning("Could not select storage location")
+
+        # Step 6: Extract LCSC category from help text
+        try:
+            help_text = await page.locator(SELECTOR_HELP_TEXT).inner_text()
+            parent, leaf = self.parse_lcsc_category(help_text)
+            lcsc_category = f"{parent} -> {leaf}" if parent else leaf
+            self.logger.debug("Extracted category: %s", lcsc_category)
+        except PlaywrightTimeout:
+            self.logger.warning(f"No category help text found for {lcsc_id}")
+            parent, leaf, lcsc_category = "", "", ""
+
+        # Step 7: Find the category among the options already loaded into the TomSelect
+        match_found = None
+        if lcsc_category:
+            await page.wait_for_function(
+                JS_TOMSELECT_READY,
+                arg=SELECTOR_CATEGORY_INPUT,
+                timeout=self.autocomplete_timeout
+            )
+            options = await page.locator(SELECTOR_CATEGORY_INPUT).evaluate(JS_CATEGORY_OPTIONS)
+            self.logger.debug("Found %s category options", len(options))
+
+            # Build expected format: dropdown shows "Leaf\n Parent" (with newline)
+            expected_format = f"{leaf}\n {parent}" if parent else leaf
+            self.logger.debug("Looking for match with format: '%s'", expected_format)
+
+            # Normalize for comparison: keep only alphanumeric chars
+            def normalize(s):
+                return ''.join(c.lower() for c in s if c.isalnum())
+
+            expected_normalized = normalize(expected_format)
+            self.logger.debug("Normalized expected: '%s'", expected_normalized)
+
+            for value, text in options:
+                # Compare normalized versions (alphanumeric only)
+                if normalize(text) == expected_normalized:
+                    match_found = value
+                    self.logger.debug("Match found: '%s' (value: %s)", text, value)
+                    break
+
+        return lcsc_category, match_found
+
+    async def save_part(self, page, lcsc_id: str, lcsc_category: str, category_value) -> str:
+        """Select or create the category and submit the create form. Returns 'success' or 'failed'."""
+        # Step 8: Select the existing category or create a new one
+        if lcsc_category:
+            if category_value is not None:
+                self.logger.info(f"Selecting existing category: {lcsc_category}")
+            else:
+                self.logger.info(f"Creating new category: {lcsc_category}")
+
+            category_select = page.locator(SELECTOR_CATEGORY_INPUT)
+            if not await category_select.evaluate(JS_SET_CATEGORY, [category_value, lcsc_category]):
+                self.logger.warning(f"Could not create category: {lcsc_category}")
+
+        # Submit the form directly instead of clicking save, so the new part's page is not rendered
+        form = await page.locator(SELECTOR_SAVE).evaluate(JS_FORM_DATA)
+        response = await page.request.post(
+            form["action"],
+            data=urlencode(form["entries"]),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            max_redirects=0,
+            timeout=self.nav_timeout
+        )
+
+        # Success redirects from the create form to the new part, otherwise the form is shown again
+        match = PART_URL_RE.search(response.headers.get("location", ""))
+        if not 300 <= response.status < 400 or not match:
+            body = await response.text()
+            errors = await page.evaluate(JS_HTML_TEXTS, [body, SELECTOR_FORM_ERRORS]) if body else []
+            self.logger.error(
+                f"Saving {lcsc_id} failed (HTTP {response.status})"
+                + "".join(f"\n  - {error}" for error in errors)
+            )
+            await self.take_error_screenshot(page, lcsc_id, body or None)
             return "failed"
 
-    def take_error_screenshot(self, lcsc_id: str):
-        """Save error screenshot."""
+        # Remember the new part so duplicate rows in the CSV and later runs skip it
+        self.cache_part(lcsc_id, int(match.group(1)))
+        if lcsc_category and category_value is None:
+            # Parts waiting for this category now find it on their form
+            self._created_categories.add(lcsc_category)
+
+        self.logger.info(f"Successfully imported {lcsc_id}")
+        return "success"
+
+    async def take_error_screenshot(self, page, lcsc_id: str, html: str = None):
+        """Save error screenshot (visible area only) and the HTML (the page HTML if not given)."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         screenshot_path = self.log_dir / "error_screenshots" / f"error_{lcsc_id}_{timestamp}.png"
         try:
-            self.page.screenshot(path=str(screenshot_path), full_page=True)
+            await page.screenshot(path=str(screenshot_path))
+            if html is None:
+                html = await page.content()
+            screenshot_path.with_suffix(".html").write_text(html, encoding="utf-8")
             self.logger.info(f"Screenshot saved: {screenshot_path}")
         except Exception as e:
             self.logger.error(f"Failed to save screenshot: {e}")
 
-    def import_parts(self, parts: list):
-        """Main import loop with progress bar."""
-        tqdm.write("[INFO] Starting import...")
+    async def new_import_page(self, context):
+        """Open a page that does not load resources which are not needed for importing."""
+        page = await context.new_page()
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception:
+            await page.close()
+            raise
+        return page
+
+    async def import_part(self, context, lcsc_id: str, amount: int) -> str:
+        """Import a single part on a fresh page. Returns 'success', 'skipped', or 'failed'."""
+        # Use a fresh page per part so the previous (large) form
+        # does not have to be unloaded before the next navigation
+        try:
+            page = await self.new_import_page(context)
+        except Exception as e:
+            # Only this part fails, the worker continues with the next one
+            self.logger.error(f"Error opening page for {lcsc_id}: {e}")
+            return "failed"
 
-        with tqdm(total=len(parts), desc="Importing parts", leave=True) as pbar:
-            for lcsc_id, amount in parts:
-                status = self.process_single_part(lcsc_id, amount)
+        try:
+            return await self.process_single_part(page, lcsc_id, amount)
+        finally:
+            try:
+                await page.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing page for {lcsc_id}: {e}")
+
+    async def import_worker(self, queue: asyncio.Queue, pbar: tqdm):
+        """Import parts from the queue using a dedicated browser context."""
+        context = await self.new_context(storage_state=self.auth_state)
+
+        try:
+            while True:
+                part = await queue.get()
+                if part is None:
+                    break
+
+                lcsc_id, amount = part
+                # A duplicate row waits for the first one and is then skipped as existing
+                async with self._part_locks.setdefault(lcsc_id, asyncio.Lock()):
+                    status = await self.import_part(context, lcsc_id, amount)
                 if status == "success":
                     self.success_count += 1
                 elif status == "skipped":
@@ -423,13 +763,40 @@ class LCSCImporter:
                     "skipped": self.skipped_count,
                     "failed": self.fail_count
                 })
+        finally:
+            await context.close()
+
+    async def queue_parts(self, parts, queue: asyncio.Queue, workers: int):
+        """Feed parts into the queue, followed by one stop marker per worker."""
+        for part in parts:
+            await queue.put(part)
+        for _ in range(workers):
+            await queue.put(None)
 
-    def cleanup(self):
+    async def import_parts(self, parts, total: int):
+        """Main import loop with progress bar."""
+        tqdm.write(f"[INFO] Starting import with {self.workers} worker(s)...")
+
+        # Keep the queue short so the CSV is only read as fast as parts are imported
+        workers = min(self.workers, total)
+        queue = asyncio.Queue(maxsize=workers)
+
+        with tqdm(total=total, desc="Importing parts", leave=True) as pbar:
+            await asyncio.gather(
+                self.queue_parts(parts, queue, workers),
+                *(self.import_worker(queue, pbar) for _ in range(workers))
+            )
+            # Invalid rows were counted in the total but never imported
+            pbar.total = pbar.n
+            pbar.refresh()
+
+    async def cleanup(self):
         """Close browser and print summary."""
         if self.browser:
-            self.browser.close()
+            await self.browser.close()
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
+        self.cache.close()
 
         total = self.success_count + self.skipped_count + self.fail_count
 
@@ -455,6 +822,41 @@ class LCSCImporter:
                 self.logger.warning(f"  - {part_id}")
             self.logger.warning("\nCheck error screenshots in logs/error_screenshots/ for details.")
 
+        # Write buffered log records to the log file
+        logging.shutdown()
+
+
+async def run(args):
+    """Authenticate and import all parts from the CSV file."""
+    try:
+        importer = LCSCImporter(
+            args.base_url, args.csv_path, args.workers, args.force_rescrape, args.timeout_multiplier,
+            args.headed
+        )
+        await importer.authenticate()
+        total = importer.count_parts_csv()
+
+        # Peek at the first valid part, the rest of the CSV is read while importing
+        parts = importer.load_parts_csv()
+        first_part = next(parts, None)
+        if first_part is None:
+            logging.error("No valid parts found in CSV")
+            sys.exit(1)
+
+        await importer.import_parts(itertools.chain([first_part], parts), total)
+        await importer.cleanup()
+
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logging.info("\nImport interrupted by user")
+        if 'importer' in locals():
+            await importer.cleanup()
+        sys.exit(1)
+    except Exception as e:
+        logging.error(f"Fatal error: {e}", exc_info=True)
+        if 'importer' in locals():
+            await importer.cleanup()
+        sys.exit(1)
+
 
 def main():
     """Main entry point."""
@@ -475,33 +877,40 @@ def main():
         default="INFO",
         help="Logging level (default: INFO)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of parts to import in parallel (default: {DEFAULT_WORKERS})"
+    )
+    parser.add_argument(
+        "--force-rescrape",
+        action="store_true",
+        help="Ignore cached existence checks and look up every part again"
+    )
+    parser.add_argument(
+        "--timeout-multiplier",
+        type=float,
+        default=1.0,
+        help="Scale all timeouts, e.g. 2 for slow servers (default: 1)"
+    )
+    parser.add_argument(
+        "--headed",
+        action="store_true",
+        help="Show the browser window while importing"
+    )
 
     args = parser.parse_args()
+    # A timeout of 0 disables Playwright's timeouts instead of making them shorter
+    if not args.timeout_multiplier > 0:
+        parser.error("--timeout-multiplier must be greater than 0")
 
     # Update logging level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
 
     try:
-        importer = LCSCImporter(args.base_url, args.csv_path)
-        importer.authenticate()
-        parts = importer.load_parts_csv()
-
-        if not parts:
-            logging.error("No valid parts found in CSV")
-            sys.exit(1)
-
-        importer.import_parts(parts)
-        importer.cleanup()
-
+        asyncio.run(run(args))
     except KeyboardInterrupt:
-        logging.info("\nImport interrupted by user")
-        if 'importer' in locals():
-            importer.cleanup()
-        sys.exit(1)
-    except Exception as e:
-        logging.error(f"Fatal error: {e}", exc_info=True)
-        if 'importer' in locals():
-            importer.cleanup()
         sys.exit(1)
 
 